@@ -0,0 +1,10 @@
+"""Reproducible benchmarks for the corpus and auth endpoints.
+
+Run everything against synthetic data and a stub NLLB model:
+
+    python -m benchmarks.run --sizes 10k,100k --out benchmarks/results/latest.json
+
+Compare two runs:
+
+    python -m benchmarks.compare benchmarks/results/baseline.json benchmarks/results/latest.json
+"""
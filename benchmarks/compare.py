@@ -0,0 +1,53 @@
+"""Compare a benchmark run against a baseline.
+
+    python -m benchmarks.compare baseline.json latest.json --threshold 0.10
+
+Exits non-zero when any benchmark's mean latency regressed by more than the threshold.
+"""
+import argparse
+import json
+import sys
+
+
+def _index(path: str):
+    with open(path, encoding="utf-8") as fh:
+        doc = json.load(fh)
+    return {(r["name"], r["size"]): r for r in doc["results"] if "skipped" not in r}
+
+
+def compare(baseline: dict, current: dict, threshold: float):
+    rows, regressions = [], []
+    for key in sorted(baseline.keys() | current.keys()):
+        old, new = baseline.get(key), current.get(key)
+        if old is None or new is None:
+            rows.append((key, old and old["mean_ms"], new and new["mean_ms"], None))
+            continue
+        change = (new["mean_ms"] - old["mean_ms"]) / old["mean_ms"] if old["mean_ms"] else 0.0
+        rows.append((key, old["mean_ms"], new["mean_ms"], change))
+        if change > threshold:
+            regressions.append(key)
+    return rows, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare benchmark results")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed relative slowdown of mean latency")
+    args = parser.parse_args(argv)
+
+    rows, regressions = compare(_index(args.baseline), _index(args.current), args.threshold)
+    for (name, size), old, new, change in rows:
+        fmt = lambda v: f"{v:10.2f}" if v is not None else f"{'-':>10}"
+        delta = f"{change:+8.1%}" if change is not None else f"{'n/a':>8}"
+        flag = "  REGRESSION" if (name, size) in regressions else ""
+        print(f"{name:<40} {size:>6} {fmt(old)} ms -> {fmt(new)} ms {delta}{flag}")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Deterministic synthetic isiZulu/English corpus generator."""
+import csv
+import random
+
+SIZES = {
+    "10k": 10_000,
+    "100k": 100_000,
+    "1M": 1_000_000,
+}
+
+# Small parallel lexicon; sentences are built word-by-word from it so the
+# pairs look like aligned text and share vocabulary the way the real corpus does.
+LEXICON = [
+    ("umfana", "boy"), ("intombazane", "girl"), ("indoda", "man"), ("umfazi", "woman"),
+    ("ingane", "child"), ("umuntu", "person"), ("abantu", "people"), ("umngane", "friend"),
+    ("uthisha", "teacher"), ("umfundi", "student"), ("udokotela", "doctor"), ("umama", "mother"),
+    ("ubaba", "father"), ("ugogo", "grandmother"), ("umkhulu", "grandfather"), ("inja", "dog"),
+    ("ikati", "cat"), ("inkomo", "cow"), ("imbuzi", "goat"), ("inkukhu", "chicken"),
+    ("indlu", "house"), ("isikole", "school"), ("isibhedlela", "hospital"), ("idolobha", "town"),
+    ("umuzi", "home"), ("insimu", "field"), ("umfula", "river"), ("intaba", "mountain"),
+    ("ilanga", "sun"), ("inyanga", "moon"), ("amanzi", "water"), ("ukudla", "food"),
+    ("isinkwa", "bread"), ("ubisi", "milk"), ("itiye", "tea"), ("imali", "money"),
+    ("incwadi", "book"), ("ipeni", "pen"), ("imoto", "car"), ("ibhasi", "bus"),
+    ("umsebenzi", "work"), ("isikhathi", "time"), ("usuku", "day"), ("ubusuku", "night"),
+    ("namuhla", "today"), ("kusasa", "tomorrow"), ("izolo", "yesterday"), ("manje", "now"),
+    ("uyahamba", "walks"), ("uyagijima", "runs"), ("uyadla", "eats"), ("uyaphuza", "drinks"),
+    ("uyafunda", "reads"), ("uyabhala", "writes"), ("uyakhuluma", "speaks"), ("uyalala", "sleeps"),
+    ("uyasebenza", "works"), ("uyathanda", "loves"), ("uyabona", "sees"), ("uyezwa", "hears"),
+    ("uyapheka", "cooks"), ("uyacula", "sings"), ("uyadlala", "plays"), ("uyafika", "arrives"),
+    ("omkhulu", "big"), ("omncane", "small"), ("omuhle", "beautiful"), ("omusha", "new"),
+    ("omdala", "old"), ("oshisayo", "hot"), ("obandayo", "cold"), ("okuningi", "many"),
+    ("kakhulu", "very"), ("futhi", "and"), ("kodwa", "but"), ("ngoba", "because"),
+    ("lapha", "here"), ("lapho", "there"), ("ekhaya", "at home"), ("esikoleni", "at school"),
+    ("emfuleni", "at the river"), ("edolobheni", "in town"), ("ensimini", "in the field"),
+    ("ngokushesha", "quickly"), ("kancane", "slowly"), ("njalo", "always"), ("namanje", "still"),
+]
+
+PUNCTUATION = [".", "!", "?", ",", ";"]
+
+
+def _sentence(rng: random.Random, min_words: int = 3, max_words: int = 15):
+    length = rng.randint(min_words, max_words)
+    words = [rng.choice(LEXICON) for _ in range(length)]
+    zulu = " ".join(z for z, _ in words)
+    english = " ".join(e for _, e in words)
+    return zulu, english
+
+
+def generate_pairs(n: int, seed: int = 0):
+    """Yield ``n`` (isizulu, english) pairs; the same seed always yields the same corpus."""
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield _sentence(rng)
+
+
+def generate_queries(pairs, n: int, seed: int = 0, hit_ratio: float = 0.5):
+    """Build a query mix of corpus sentences (hits) and unseen sentences (misses).
+
+    Returns a list of ``(isizulu, english, is_hit)`` tuples.
+    """
+    rng = random.Random(seed + 1)
+    queries = []
+    for _ in range(n):
+        if pairs and rng.random() < hit_ratio:
+            zulu, english = rng.choice(pairs)
+            queries.append((zulu, english, True))
+        else:
+            # Longer than any corpus sentence so it cannot be an exact hit.
+            zulu, english = _sentence(rng, min_words=16, max_words=24)
+            queries.append((zulu, english, False))
+    return queries
+
+
+def noisy_text(rng: random.Random, n_words: int = 12) -> str:
+    """Mixed-case, punctuated raw input of the kind ``normalize_text`` receives."""
+    parts = []
+    for _ in range(n_words):
+        word = rng.choice(LEXICON)[rng.randint(0, 1)]
+        if rng.random() < 0.2:
+            word = word.capitalize()
+        if rng.random() < 0.15:
+            word += rng.choice(PUNCTUATION)
+        parts.append(word)
+    return "  ".join(parts)
+
+
+def write_csv(path: str, n: int, seed: int = 0):
+    """Write a corpus CSV with the ``isizulu,english`` header the importers expect."""
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["isizulu", "english"])
+        writer.writerows(generate_pairs(n, seed))
+    return path
@@ -0,0 +1,149 @@
+"""Timing, result collection and app/database setup shared by the benchmarks."""
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def bootstrap(data_dir: str):
+    """Point the app at a scratch SQLite database and the stub NLLB model.
+
+    Has to run before anything imports ``config``, ``app`` or ``routes``:
+    ``Config`` reads ``DATABASE_URL`` at import time and ``services.translate``
+    loads the model at import time.
+    """
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    os.makedirs(data_dir, exist_ok=True)
+    os.environ["DATABASE_URL"] = sqlite_url(os.path.join(data_dir, "bootstrap.sqlite"))
+
+    from benchmarks import stub_nllb
+    stub_nllb.install()
+
+
+def sqlite_url(path: str) -> str:
+    return "sqlite:///" + os.path.abspath(path).replace("\\", "/")
+
+
+def make_app(database_url: str):
+    """Build an app instance through the real ``create_app`` bound to ``database_url``."""
+    from config import Config
+    from app import create_app
+    from extensions import db
+
+    Config.SQLALCHEMY_DATABASE_URI = database_url
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def load_corpus(app, pairs, batch_size: int = 10_000):
+    """Bulk-load ``pairs`` into ``translations`` (schema is recreated)."""
+    from sqlalchemy import insert
+    from extensions import db
+    from models import Translation
+
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        for start in range(0, len(pairs), batch_size):
+            chunk = pairs[start:start + batch_size]
+            db.session.execute(
+                insert(Translation),
+                [{"isizulu_text": z, "english_text": e} for z, e in chunk],
+            )
+        db.session.commit()
+
+
+def corpus_row_count(app) -> int:
+    from sqlalchemy import inspect
+    from extensions import db
+    from models import Translation
+
+    with app.app_context():
+        if not inspect(db.engine).has_table(Translation.__tablename__):
+            return 0
+        return Translation.query.count()
+
+
+def measure(fn, repeat: int = 5, warmup: int = 1):
+    """Call ``fn`` ``warmup + repeat`` times and return the timed samples in seconds."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    k = (len(ordered) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def summarize(samples, ops_per_sample: int = 1) -> dict:
+    """Latency summary in milliseconds; throughput counts ``ops_per_sample`` per sample."""
+    total = sum(samples)
+    return {
+        "samples": len(samples),
+        "mean_ms": statistics.fmean(samples) * 1000 if samples else 0.0,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "min_ms": min(samples) * 1000 if samples else 0.0,
+        "max_ms": max(samples) * 1000 if samples else 0.0,
+        "ops_per_s": (len(samples) * ops_per_sample / total) if total else 0.0,
+    }
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Results:
+    """Accumulates benchmark records and writes them as one JSON document."""
+
+    def __init__(self, **params):
+        self.meta = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": params,
+        }
+        self.records = []
+
+    def add(self, name: str, size: str, stats: dict, **extra):
+        record = {"name": name, "size": size, **stats, **extra}
+        self.records.append(record)
+        print(f"  {name:<40} {size:>6}  mean {stats.get('mean_ms', 0):9.2f} ms"
+              f"  p95 {stats.get('p95_ms', 0):9.2f} ms  {stats.get('ops_per_s', 0):9.1f} op/s")
+        return record
+
+    def skip(self, name: str, size: str, reason: str):
+        self.records.append({"name": name, "size": size, "skipped": reason})
+        print(f"  {name:<40} {size:>6}  skipped: {reason}")
+
+    def write(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump({"meta": self.meta, "results": self.records}, fh, indent=2)
+        return path
@@ -0,0 +1,122 @@
+"""End-to-end load tests for ``/corpus/analyze`` and ``/auth/login``.
+
+Requests go either through the Flask test client (``transport="client"``) or
+over HTTP to a local werkzeug server running the same app (``transport="wsgi"``).
+"""
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.harness import summarize
+
+LOGIN_EMAIL = "bench@example.com"
+LOGIN_PASSWORD = "bench-password"
+
+
+class _ClientTransport:
+    def __init__(self, app):
+        self.app = app
+        self._local = threading.local()
+
+    def post(self, path: str, payload: dict) -> int:
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self.app.test_client()
+        return client.post(path, json=payload).status_code
+
+    def close(self):
+        pass
+
+
+class _WSGITransport:
+    def __init__(self, app):
+        from werkzeug.serving import WSGIRequestHandler, make_server
+
+        class QuietHandler(WSGIRequestHandler):
+            def log_request(self, *args, **kwargs):
+                pass
+
+        self.server = make_server("127.0.0.1", 0, app, threaded=True, request_handler=QuietHandler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def post(self, path: str, payload: dict) -> int:
+        req = urllib.request.Request(
+            self.base_url + path,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(req) as resp:
+                resp.read()
+                return resp.status
+        except urllib.error.HTTPError as exc:
+            return exc.code
+
+    def close(self):
+        self.server.shutdown()
+        self.thread.join()
+
+
+TRANSPORTS = {"client": _ClientTransport, "wsgi": _WSGITransport}
+
+
+def seed_login_user(app):
+    from extensions import db
+    from models import User
+
+    with app.app_context():
+        db.create_all()
+        if not User.query.filter_by(email=LOGIN_EMAIL).first():
+            user = User(email=LOGIN_EMAIL, full_name="Bench User")
+            user.set_password(LOGIN_PASSWORD)
+            db.session.add(user)
+            db.session.commit()
+
+
+def run_load(transport, path: str, payloads, concurrency: int, expected_status: int = 200):
+    """Fire every payload at ``path`` from ``concurrency`` workers; return stats."""
+    def one(payload):
+        start = time.perf_counter()
+        status = transport.post(path, payload)
+        return time.perf_counter() - start, status
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(one, payloads))
+    wall = time.perf_counter() - wall_start
+
+    samples = [elapsed for elapsed, _ in outcomes]
+    errors = sum(1 for _, status in outcomes if status != expected_status)
+    stats = summarize(samples)
+    # Under concurrency, throughput is requests over wall-clock time.
+    stats["ops_per_s"] = len(payloads) / wall if wall else 0.0
+    stats.update({"requests": len(payloads), "concurrency": concurrency, "errors": errors})
+    return stats
+
+
+def bench_endpoints(results, app, size: str, queries, requests: int, concurrency: int,
+                    transport: str = "client"):
+    seed_login_user(app)
+    conn = TRANSPORTS[transport](app)
+    try:
+        analyze = []
+        for i in range(requests):
+            zulu, english, _ = queries[i % len(queries)]
+            if i % 4 == 3:
+                analyze.append({"sentence": english, "src_lang": "eng", "tgt_lang": "zul"})
+            else:
+                analyze.append({"sentence": zulu, "src_lang": "zul", "tgt_lang": "eng"})
+        stats = run_load(conn, "/corpus/analyze", analyze, concurrency)
+        results.add(f"POST /corpus/analyze [{transport}]", size, stats)
+
+        login = [{"email": LOGIN_EMAIL, "password": LOGIN_PASSWORD}] * requests
+        stats = run_load(conn, "/auth/login", login, concurrency)
+        results.add(f"POST /auth/login [{transport}]", size, stats)
+    finally:
+        conn.close()
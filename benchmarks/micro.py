@@ -0,0 +1,147 @@
+"""Microbenchmarks for the corpus helpers and the CSV importers."""
+import contextlib
+import io
+import os
+import random
+
+from benchmarks import corpus_gen
+from benchmarks.harness import measure, sqlite_url, summarize
+
+
+def bench_normalize_text(results, n: int = 10_000, seed: int = 0):
+    from routes.corpus import normalize_text
+
+    rng = random.Random(seed)
+    inputs = [corpus_gen.noisy_text(rng) for _ in range(n)]
+
+    def run():
+        for text in inputs:
+            normalize_text(text)
+
+    samples = measure(run, repeat=5)
+    results.add("normalize_text", "n/a", summarize(samples, ops_per_sample=n), inputs=n)
+
+
+def bench_translator(results, lengths=(50, 200, 800), seed: int = 0):
+    """``Translator.translate`` on long inputs, with a cold and a warm segment cache."""
+    from services.translate import nllb_translator
+
+    rng = random.Random(seed)
+    for n_words in lengths:
+        text = " ".join(rng.choice(corpus_gen.LEXICON)[0] for _ in range(n_words))
+
+        def cold():
+            nllb_translator.cache.clear()
+            nllb_translator.translate(text, src_lang="zul_Latn", tgt_lang="eng_Latn")
+
+        samples = measure(cold, repeat=3)
+        results.add(f"Translator.translate[{n_words}w,cold]", "n/a", summarize(samples), words=n_words)
+
+        samples = measure(lambda: nllb_translator.translate(text, src_lang="zul_Latn", tgt_lang="eng_Latn"),
+                          repeat=3)
+        results.add(f"Translator.translate[{n_words}w,warm]", "n/a", summarize(samples), words=n_words)
+    nllb_translator.cache.clear()
+
+
+def bench_profiles(results, n: int = 64, seed: int = 0):
+    """Per-sentence latency and throughput of each generation profile, cold cache."""
+    from services.translate import GENERATION_PROFILES, nllb_translator
+
+    pairs = list(corpus_gen.generate_pairs(n, seed + 2))
+    for profile in GENERATION_PROFILES:
+        nllb_translator.cache.clear()
+        it = iter(pairs * 2)
+        samples = measure(
+            lambda: nllb_translator.translate(next(it)[0], src_lang="zul_Latn", tgt_lang="eng_Latn",
+                                              profile=profile),
+            repeat=n - 1,
+        )
+        results.add(f"Translator.translate[profile={profile}]", "n/a", summarize(samples),
+                    profile=profile, **GENERATION_PROFILES[profile])
+    nllb_translator.cache.clear()
+
+
+def bench_corpus_helpers(results, app, size: str, queries, repeat: int):
+    """``get_translation``, ``analyze_word`` and ``get_common_pairs`` against a loaded corpus."""
+    from extensions import db
+    from models import PrecomputedTranslation
+    from routes.corpus import analyze_word, get_common_pairs, get_translation, translation_memory
+    from scripts import warm_translations
+    from services.translate import nllb_translator
+
+    hits = [q for q in queries if q[2]][:repeat]
+    misses = [q for q in queries if not q[2]][:repeat]
+    words = [q[0].split()[0] for q in queries[:repeat]]
+
+    with app.app_context():
+        translation_memory.reset_stats()
+        for label, batch in (("hit", hits), ("miss", misses)):
+            if not batch:
+                results.skip(f"get_translation[zul->eng,{label}]", size, "no queries")
+                continue
+            it = iter(batch * 2)
+            samples = measure(lambda: get_translation(next(it)[0], "zul", "eng"), repeat=len(batch))
+            results.add(f"get_translation[zul->eng,{label}]", size, summarize(samples))
+        results.meta.setdefault("translation_memory", {})[size] = translation_memory.stats()
+
+        xho = [q[0] for q in queries[:repeat]]
+        it = iter(xho * 2)
+        samples = measure(lambda: get_translation(next(it), "zul", "xho"), repeat=len(xho))
+        results.add("get_translation[zul->xho]", size, summarize(samples))
+
+        # Same requests once the warm-up job has precomputed them.
+        warm_translations.warm({("zul", "xho"): xho}, nllb_translator.profile)
+        nllb_translator.cache.clear()
+        it = iter(xho * 2)
+        samples = measure(lambda: get_translation(next(it), "zul", "xho"), repeat=len(xho))
+        results.add("get_translation[zul->xho,precomputed]", size, summarize(samples))
+        PrecomputedTranslation.query.delete()
+        db.session.commit()
+
+        it = iter(words * 2)
+        samples = measure(lambda: analyze_word(next(it), "zul"), repeat=len(words))
+        results.add("analyze_word", size, summarize(samples))
+
+        it = iter(queries[:repeat] * 2)
+        samples = measure(lambda: get_common_pairs(next(it)[0], "zul"), repeat=min(repeat, len(queries)))
+        results.add("get_common_pairs", size, summarize(samples))
+
+
+def bench_importers(results, data_dir: str, size: str, n: int, seed: int):
+    csv_path = corpus_gen.write_csv(os.path.join(data_dir, f"import-{size}.csv"), n, seed)
+    target = os.path.join(data_dir, f"import-{size}.sqlite")
+
+    try:
+        import csv_to_database
+    except ImportError as exc:
+        results.skip("import_csv_data", size, f"missing dependency: {exc.name}")
+    else:
+        samples = _time_import(target, lambda: csv_to_database.import_csv_data(csv_path, confirm=False))
+        results.add("import_csv_data", size, summarize(samples, ops_per_sample=n), rows=n)
+
+    try:
+        from scripts import prepare_data
+        prepare_data.clean_and_tokenize("warm up the tokenizer")
+    except ImportError as exc:
+        results.skip("prepare_data", size, f"missing dependency: {exc.name}")
+    except LookupError:
+        results.skip("prepare_data", size, "nltk punkt data not downloaded")
+    else:
+        samples = _time_import(target, lambda: prepare_data.prepare_data(csv_path))
+        results.add("prepare_data", size, summarize(samples, ops_per_sample=n), rows=n)
+
+
+def _time_import(target: str, fn):
+    """Time one import into a fresh database; the importers are too slow to repeat."""
+    from config import Config
+
+    if os.path.exists(target):
+        os.remove(target)
+    # The importers build their own app via create_app(), which reads Config.
+    previous = Config.SQLALCHEMY_DATABASE_URI
+    Config.SQLALCHEMY_DATABASE_URI = sqlite_url(target)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return measure(fn, repeat=1, warmup=0)
+    finally:
+        Config.SQLALCHEMY_DATABASE_URI = previous
@@ -0,0 +1,76 @@
+"""Run the benchmark suite and write the results as JSON.
+
+    python -m benchmarks.run --sizes 10k,100k,1M --out benchmarks/results/latest.json
+"""
+import argparse
+import os
+import sys
+
+from benchmarks import corpus_gen, harness
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Corpus/auth benchmark suite")
+    parser.add_argument("--sizes", default="10k",
+                        help=f"comma-separated corpus sizes from {', '.join(corpus_gen.SIZES)}")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=10,
+                        help="calls per microbenchmark")
+    parser.add_argument("--requests", type=int, default=200,
+                        help="requests per endpoint in the load test")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--transport", choices=["client", "wsgi"], default="client")
+    parser.add_argument("--max-import-rows", type=int, default=100_000,
+                        help="skip importer benchmarks for larger corpora")
+    parser.add_argument("--skip", default="",
+                        help="comma-separated groups to skip: micro, import, load")
+    parser.add_argument("--data-dir", default=os.path.join("benchmarks", ".data"))
+    parser.add_argument("--out", default=os.path.join("benchmarks", "results", "latest.json"))
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = [s.strip() for s in args.sizes.split(",") if s.strip()]
+    unknown = [s for s in sizes if s not in corpus_gen.SIZES]
+    if unknown:
+        sys.exit(f"unknown size(s): {', '.join(unknown)}")
+    skip = {s.strip() for s in args.skip.split(",") if s.strip()}
+
+    harness.bootstrap(args.data_dir)
+    from benchmarks import load, micro
+
+    results = harness.Results(**vars(args))
+
+    if "micro" not in skip:
+        micro.bench_normalize_text(results, seed=args.seed)
+        micro.bench_translator(results, seed=args.seed)
+        micro.bench_profiles(results, seed=args.seed)
+
+    for size in sizes:
+        n = corpus_gen.SIZES[size]
+        print(f"[{size}] preparing corpus of {n} pairs")
+        pairs = list(corpus_gen.generate_pairs(n, args.seed))
+        queries = corpus_gen.generate_queries(pairs, max(args.repeat, 50) * 2, args.seed)
+
+        db_path = os.path.join(args.data_dir, f"corpus-{size}-seed{args.seed}.sqlite")
+        app = harness.make_app(harness.sqlite_url(db_path))
+        if harness.corpus_row_count(app) != n:
+            harness.load_corpus(app, pairs)
+
+        if "micro" not in skip:
+            micro.bench_corpus_helpers(results, app, size, queries, args.repeat)
+        if "import" not in skip:
+            if n <= args.max_import_rows:
+                micro.bench_importers(results, args.data_dir, size, n, args.seed)
+            else:
+                results.skip("importers", size, f"larger than --max-import-rows={args.max_import_rows}")
+        if "load" not in skip:
+            load.bench_endpoints(results, app, size, queries, args.requests,
+                                 args.concurrency, args.transport)
+
+    print(f"results written to {results.write(args.out)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Stand-in for the NLLB tokenizer and model used by ``services.translate``.
+
+The stub keeps the call shapes ``Translator`` relies on (tokenizer ``__call__``,
+``convert_tokens_to_ids``, ``batch_decode`` and ``model.generate``) and charges a
+synthetic cost per call: a fixed overhead, a quadratic encoder term and a linear
+decoder term, so batching and input length show up in the numbers the way they
+do with the real model. "Translation" echoes the source words.
+"""
+import sys
+import time
+import types
+
+# NLLB's generation_config ships max_length=200.
+DEFAULT_MAX_LENGTH = 200
+
+
+class StubTokenizer:
+    def __init__(self):
+        self.src_lang = "eng_Latn"
+        self.pad_token_id = 1
+        self.eos_token_id = 2
+        self._vocab = {"<pad>": 1, "</s>": 2}
+        self._inverse = {1: "<pad>", 2: "</s>"}
+        self._special = {1, 2}
+
+    def _token_id(self, token: str) -> int:
+        tid = self._vocab.get(token)
+        if tid is None:
+            tid = len(self._vocab) + 3
+            self._vocab[token] = tid
+            self._inverse[tid] = token
+        return tid
+
+    def convert_tokens_to_ids(self, token: str) -> int:
+        tid = self._token_id(token)
+        self._special.add(tid)
+        return tid
+
+    def __call__(self, text, return_tensors=None, padding=False, truncation=False, max_length=None):
+        texts = [text] if isinstance(text, str) else list(text)
+        src = self.convert_tokens_to_ids(self.src_lang)
+        rows = [[src] + [self._token_id(w) for w in t.split()] + [self.eos_token_id] for t in texts]
+        if truncation and max_length:
+            rows = [r[:max_length] for r in rows]
+        width = max(len(r) for r in rows)
+        masks = [[1] * len(r) + [0] * (width - len(r)) for r in rows]
+        rows = [r + [self.pad_token_id] * (width - len(r)) for r in rows]
+        return {"input_ids": rows, "attention_mask": masks}
+
+    def batch_decode(self, sequences, skip_special_tokens=False):
+        out = []
+        for seq in sequences:
+            tokens = [
+                self._inverse.get(t, "")
+                for t in seq
+                if not (skip_special_tokens and t in self._special)
+            ]
+            out.append(" ".join(t for t in tokens if t))
+        return out
+
+
+class StubModel:
+    def __init__(self, call_overhead=0.002, encoder_cost=2e-6, decoder_cost=5e-5):
+        self.call_overhead = call_overhead
+        self.encoder_cost = encoder_cost
+        self.decoder_cost = decoder_cost
+        self.calls = 0
+
+    def eval(self):
+        return self
+
+    def generate(self, input_ids, attention_mask=None, forced_bos_token_id=None,
+                 max_length=None, max_new_tokens=None, num_beams=1, **kwargs):
+        self.calls += 1
+        batch = len(input_ids)
+        width = len(input_ids[0]) if batch else 0
+        # Decoder output = [</s>, tgt_lang, tokens..., </s>], capped like HF does.
+        limit = max_new_tokens + 1 if max_new_tokens is not None else (max_length or DEFAULT_MAX_LENGTH)
+
+        outputs = []
+        steps = 0
+        for row, mask in zip(input_ids, attention_mask or [[1] * width] * batch):
+            content = [t for t, m in zip(row[1:], mask[1:]) if m and t != 2]
+            seq = [2, forced_bos_token_id] + content + [2]
+            seq = seq[:limit]
+            steps = max(steps, len(seq))
+            outputs.append(seq)
+
+        time.sleep(
+            self.call_overhead
+            + batch * self.encoder_cost * width * width
+            + batch * num_beams * self.decoder_cost * steps
+        )
+        return [seq + [1] * (steps - len(seq)) for seq in outputs]
+
+
+def install(**model_kwargs):
+    """Make ``transformers`` resolve to the stub for this process.
+
+    Must run before ``services.translate`` is imported; if it was already
+    imported, the live ``nllb_translator`` is re-pointed at the stub instead.
+    """
+    module = types.ModuleType("transformers")
+
+    class AutoTokenizer:
+        @staticmethod
+        def from_pretrained(name, **kwargs):
+            return StubTokenizer()
+
+    class AutoModelForSeq2SeqLM:
+        @staticmethod
+        def from_pretrained(name, **kwargs):
+            return StubModel(**model_kwargs)
+
+    module.AutoTokenizer = AutoTokenizer
+    module.AutoModelForSeq2SeqLM = AutoModelForSeq2SeqLM
+    sys.modules["transformers"] = module
+
+    translate = sys.modules.get("services.translate")
+    if translate is not None:
+        translate.nllb_translator.tokenizer = StubTokenizer()
+        translate.nllb_translator.model = StubModel(**model_kwargs)
+    return module
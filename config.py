@@ -24,4 +24,8 @@ class Config:
     MAIL_PASSWORD = os.getenv("MAIL_PASSWORD")
     MAIL_DEFAULT_SENDER = os.getenv("MAIL_DEFAULT_SENDER")
 
-
+    # NLLB generation: default profile (see services.translate.GENERATION_PROFILES)
+    # and torch thread counts for the worker (0 keeps torch's default).
+    TRANSLATION_PROFILE = os.getenv("TRANSLATION_PROFILE", "balanced")
+    TORCH_NUM_THREADS = int(os.getenv("TORCH_NUM_THREADS", "0"))
+    TORCH_NUM_INTEROP_THREADS = int(os.getenv("TORCH_NUM_INTEROP_THREADS", "0"))
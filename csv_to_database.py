@@ -10,12 +10,12 @@ from app import create_app
 from extensions import db
 from models import ZuluEnglishPair
 
-def import_csv_data():
+# File path to your CSV
+CSV_FILE_PATH = r"C:\Users\mthok\isuzu_corpus__backend\data\corpus.csv"
+
+def import_csv_data(csv_file_path=CSV_FILE_PATH, confirm=True):
     """One-time script to import CSV data"""
     
-    # File path to your CSV
-    csv_file_path = r"C:\Users\mthok\isuzu_corpus__backend\data\corpus.csv"
-    
     # Check if file exists
     if not os.path.exists(csv_file_path):
         print(f"❌ File not found: {csv_file_path}")
@@ -56,7 +56,7 @@ def import_csv_data():
         print(f"📊 Existing records in database: {existing_count}")
         
         # Ask for confirmation
-        if existing_count > 0:
+        if existing_count > 0 and confirm:
             response = input(f"\n⚠️  Database already has {existing_count} records. Continue importing? (y/n): ")
             if response.lower() != 'y':
                 print("❌ Import cancelled.")
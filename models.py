@@ -1,3 +1,4 @@
+import hashlib
 from datetime import datetime
 from extensions import db, bcrypt
 
@@ -50,6 +51,36 @@ class RevokedToken(db.Model):
         self.jti = jti
 
 
+class PrecomputedTranslation(db.Model):
+    """NLLB output filled in offline by scripts/warm_translations.py."""
+    __tablename__ = "precomputed_translations"
+    __table_args__ = (
+        db.UniqueConstraint("src_lang", "tgt_lang", "profile", "source_hash"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    src_lang = db.Column(db.String(8), nullable=False)   # "zul" / "xho" / "eng"
+    tgt_lang = db.Column(db.String(8), nullable=False)
+    profile = db.Column(db.String(32), nullable=False)
+    source_hash = db.Column(db.String(64), nullable=False)  # sha256 of source_text
+    source_text = db.Column(db.Text, nullable=False)
+    translated_text = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def lookup(cls, text, src_lang, tgt_lang, profile):
+        return db.session.query(cls.translated_text).filter_by(
+            src_lang=src_lang,
+            tgt_lang=tgt_lang,
+            profile=profile,
+            source_hash=cls.hash_text(text),
+        ).scalar()
+
+
 class ZuluEnglishPair(db.Model):
     __tablename__ = 'zulu_english_pairs'
     
@@ -1,7 +1,9 @@
 from flask import Blueprint, request, jsonify
-from models import Translation
-from services.translate import nllb_translator
-from rapidfuzz import fuzz, process
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from extensions import db
+from models import Translation, PrecomputedTranslation
+from services.translate import nllb_translator, split_sentences, GENERATION_PROFILES
+from services.translation_memory import TranslationMemory
 import re
 from collections import Counter
 
@@ -28,6 +30,19 @@ def normalize_text(text: str) -> str:
     return text.strip()
 
 
+def split_input(text):
+    """Normalize raw input sentence by sentence.
+
+    Returns the normalized text (for corpus lookups and analysis) and its
+    normalized sentences, so NLLB still gets the sentence boundaries that
+    normalize_text would otherwise strip.
+    """
+    sentences = [s for s in (normalize_text(s) for s in split_sentences(text)) if s]
+    return " ".join(sentences), sentences
+
+
+translation_memory = TranslationMemory(normalize_text)
+
 
 def get_common_pairs(sentence: str, lang: str, top_n: int = 5):
     """Return common word pairs from dataset that relate to words in sentence."""
@@ -85,40 +100,47 @@ def analyze_word(word: str, lang: str):
     return results
 
 
-def get_translation(sentence: str, src_lang: str, tgt_lang: str):
+def translate_with_nllb(sentence: str, src_lang: str, tgt_lang: str, profile: str = None,
+                        sentences=None):
+    """NLLB fallback; served from the warm-up table when precomputed offline."""
+    profile = profile or nllb_translator.profile
+    try:
+        precomputed = PrecomputedTranslation.lookup(sentence, src_lang, tgt_lang, profile)
+    except (OperationalError, ProgrammingError):
+        # Warm-up is optional: no precomputed_translations table means a miss.
+        db.session.rollback()
+        precomputed = None
+    if precomputed is not None:
+        return precomputed
+    return nllb_translator.translate(
+        sentences or sentence,
+        src_lang=nllb_map[src_lang], tgt_lang=nllb_map[tgt_lang], profile=profile
+    )
+
+
+def get_translation(sentence: str, src_lang: str, tgt_lang: str, profile: str = None,
+                    sentences=None):
     if src_lang == "xho" or tgt_lang == "xho":
         # always NLLB for isiXhosa
-        return nllb_translator.translate(
-            sentence, src_lang=nllb_map[src_lang], tgt_lang=nllb_map[tgt_lang]
-        )
+        return translate_with_nllb(sentence, src_lang, tgt_lang, profile, sentences)
 
     src_field = field_map[src_lang]
     tgt_field = field_map[tgt_lang]
 
-    # 1. Fetch all rows
-    candidates = Translation.query.all()
-    if not candidates:
-        return nllb_translator.translate(
-            sentence, src_lang=nllb_map[src_lang], tgt_lang=nllb_map[tgt_lang]
-        )
-
-    # 2. Build search space
-    search_space = [getattr(c, src_field) for c in candidates if getattr(c, src_field)]
-
-    # 3. Fuzzy match against corpus
-    best = process.extractOne(sentence, search_space, scorer=fuzz.token_sort_ratio)
-
-    if best:
-        best_match, score, idx = best
-        if score > 70:  # threshold
-            matched_row = candidates[idx]
+    # 1. Corpus match: exact hash, then fuzzy scan over rows that can beat the threshold
+    for attempt in range(2):
+        row_id = translation_memory.lookup(sentence, src_field)
+        if row_id is None:
+            break
+        matched_row = db.session.get(Translation, row_id)
+        if matched_row is not None:
             # ✅ return FULL DB translation (not cut)
             return getattr(matched_row, tgt_field)
+        # Row deleted since the index was built: rebuild and look up once more
+        translation_memory.invalidate()
 
-    # 4. Fallback → NLLB
-    return nllb_translator.translate(
-        sentence, src_lang=nllb_map[src_lang], tgt_lang=nllb_map[tgt_lang]
-    )
+    # 2. Fallback → NLLB
+    return translate_with_nllb(sentence, src_lang, tgt_lang, profile, sentences)
 
 
 @corpus_bp.route("/analyze", methods=["POST"])
@@ -127,12 +149,15 @@ def analyze_sentence():
     if not data or "sentence" not in data or "src_lang" not in data or "tgt_lang" not in data:
         return jsonify({"error": "Request must include 'sentence', 'src_lang' and 'tgt_lang'"}), 400
 
-    sentence = normalize_text(data["sentence"])
+    sentence, sentences = split_input(data["sentence"])
     src_lang = data["src_lang"]
     tgt_lang = data["tgt_lang"]
+    profile = data.get("profile")  # optional NLLB generation profile
+    if profile is not None and (not isinstance(profile, str) or profile not in GENERATION_PROFILES):
+        return jsonify({"error": f"'profile' must be one of: {', '.join(GENERATION_PROFILES)}"}), 400
 
     # 1. Translation
-    translation = get_translation(sentence, src_lang, tgt_lang)
+    translation = get_translation(sentence, src_lang, tgt_lang, profile, sentences)
 
     if src_lang == "xho" or tgt_lang == "xho":
         # isiXhosa → only translation
@@ -154,3 +179,8 @@ def analyze_sentence():
             "common_pairs": common_pairs
         }
     })
+
+
+@corpus_bp.route("/metrics", methods=["GET"])
+def metrics():
+    return jsonify({"translation_memory": translation_memory.stats()})
@@ -0,0 +1,192 @@
+"""Precompute NLLB translations for frequent sentences, outside the request path.
+
+Input is either a sentence list (one sentence per line, in --src, translated
+into every other language in nllb_map) or a query log of JSON lines with
+"sentence", "src_lang" and "tgt_lang" (e.g. logged /corpus/analyze bodies).
+The most frequent sentences are translated in large batches across a process
+pool and stored in precomputed_translations, which get_translation checks
+before running NLLB.
+
+    python scripts/warm_translations.py queries.jsonl --workers 4
+    python scripts/warm_translations.py sentences.txt --src zul --limit 50000
+"""
+import argparse
+import json
+import os
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from app import create_app
+from config import Config
+from extensions import db
+from models import PrecomputedTranslation
+from routes.corpus import field_map, nllb_map, split_input, translation_memory
+from services.translate import nllb_translator, set_torch_threads
+
+
+def read_requests(paths, src=None):
+    """Count normalized (sentence, src_lang, tgt_lang) requests across the input files.
+
+    Also returns each normalized sentence's split into sentences, so the
+    warm-up translates with the same boundaries /corpus/analyze uses.
+    """
+    counts = Counter()
+    segmented = {}
+    for path in paths:
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line:
+                    continue
+                if line.startswith(("{", "[")):
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    # Skip malformed log entries rather than abort the run
+                    if not isinstance(entry, dict):
+                        continue
+                    sentence = entry.get("sentence")
+                    pairs = [(entry.get("src_lang"), entry.get("tgt_lang"))]
+                    if not all(isinstance(v, str) for v in (sentence, *pairs[0])):
+                        continue
+                else:
+                    if src is None:
+                        raise ValueError(f"{path}: plain sentence lists need --src")
+                    sentence = line
+                    pairs = [(src, tgt) for tgt in nllb_map if tgt != src]
+
+                sentence, sentences = split_input(sentence)
+                if not sentence:
+                    continue
+                segmented.setdefault(sentence, sentences)
+                for s, t in pairs:
+                    if s in nllb_map and t in nllb_map and s != t:
+                        counts[(sentence, s, t)] += 1
+    return counts, segmented
+
+
+def select_pending(counts, profile, limit=None):
+    """Most frequent requests that neither the corpus nor the table already answers."""
+    pending = defaultdict(list)
+    for (sentence, src, tgt), _ in counts.most_common(limit):
+        # get_translation answers these from the corpus without NLLB
+        if "xho" not in (src, tgt) and translation_memory.lookup(sentence, field_map[src]) is not None:
+            continue
+        pending[(src, tgt)].append(sentence)
+
+    for (src, tgt), sentences in pending.items():
+        done = set()
+        for start in range(0, len(sentences), 1000):
+            hashes = [PrecomputedTranslation.hash_text(s) for s in sentences[start:start + 1000]]
+            done.update(h for (h,) in db.session.query(PrecomputedTranslation.source_hash).filter(
+                PrecomputedTranslation.src_lang == src,
+                PrecomputedTranslation.tgt_lang == tgt,
+                PrecomputedTranslation.profile == profile,
+                PrecomputedTranslation.source_hash.in_(hashes),
+            ))
+        sentences[:] = [s for s in sentences if PrecomputedTranslation.hash_text(s) not in done]
+    return {pair: sentences for pair, sentences in pending.items() if sentences}
+
+
+def _init_worker(num_threads):
+    set_torch_threads(num_threads)
+
+
+def _translate_chunk(src, tgt, profile, sentences, segmented):
+    translations = nllb_translator.translate_many(
+        segmented, src_lang=nllb_map[src], tgt_lang=nllb_map[tgt], profile=profile
+    )
+    return src, tgt, sentences, translations
+
+
+def store(src, tgt, profile, sentences, translations):
+    db.session.add_all([
+        PrecomputedTranslation(
+            src_lang=src,
+            tgt_lang=tgt,
+            profile=profile,
+            source_hash=PrecomputedTranslation.hash_text(sentence),
+            source_text=sentence,
+            translated_text=translation,
+        )
+        for sentence, translation in zip(sentences, translations)
+    ])
+    db.session.commit()
+    return len(sentences)
+
+
+def warm(pending, profile, workers=1, chunk_size=256, threads_per_worker=None, segmented=None):
+    """Translate ``pending`` ({(src, tgt): [sentences]}) and store the results.
+
+    ``segmented`` maps a normalized sentence to its sentence split (see
+    read_requests); sentences without one are translated as-is.
+
+    ``workers`` <= 1 translates in this process. Each pool worker gets
+    ``threads_per_worker`` torch threads, by default an even share of the CPUs
+    so the pool does not oversubscribe them. Returns the number of rows stored.
+    """
+    chunks = [
+        (src, tgt, profile, batch, [(segmented or {}).get(s) or s for s in batch])
+        for (src, tgt), sentences in pending.items()
+        for start in range(0, len(sentences), chunk_size)
+        for batch in [sentences[start:start + chunk_size]]
+    ]
+    if workers <= 1:
+        results = (_translate_chunk(*chunk) for chunk in chunks)
+        return sum(store(src, tgt, profile, sentences, translations)
+                   for src, tgt, sentences, translations in results)
+
+    if threads_per_worker is None:
+        threads_per_worker = max(1, (os.cpu_count() or 1) // workers)
+
+    totals = {pair: len(sentences) for pair, sentences in pending.items()}
+    stored = Counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(threads_per_worker,)) as pool:
+        futures = [pool.submit(_translate_chunk, *chunk) for chunk in chunks]
+        for future in futures:
+            src, tgt, sentences, translations = future.result()
+            stored[(src, tgt)] += store(src, tgt, profile, sentences, translations)
+            print(f"✅ {src}->{tgt}: {stored[(src, tgt)]}/{totals[(src, tgt)]} stored")
+    return sum(stored.values())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("inputs", nargs="+", help="sentence lists or JSON-lines query logs")
+    parser.add_argument("--src", choices=list(nllb_map),
+                        help="language of plain-text sentence lists")
+    parser.add_argument("--limit", type=int, default=None,
+                        help="only the N most frequent requests")
+    parser.add_argument("--profile", default=Config.TRANSLATION_PROFILE)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--threads-per-worker", type=int, default=None,
+                        help="torch intra-op threads per worker (default: CPUs / workers)")
+    args = parser.parse_args(argv)
+
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+
+        try:
+            counts, segmented = read_requests(args.inputs, args.src)
+        except ValueError as e:
+            parser.error(str(e))
+        print(f"📁 {len(counts)} distinct requests read")
+
+        pending = select_pending(counts, args.profile, args.limit)
+        total = sum(len(s) for s in pending.values())
+        print(f"🔄 {total} sentences to translate across {len(pending)} language pairs")
+
+        stored = warm(pending, args.profile, args.workers, args.chunk_size,
+                      args.threads_per_worker, segmented)
+        print(f"🎉 Warm-up complete: {stored} translations stored")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,189 @@
+import logging
+import re
+import threading
+from collections import OrderedDict
+
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
 
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Named generate() settings. The output budget is per batch:
+# min(max_new_tokens, length_ratio * input_tokens + length_slack), which stops
+# runaway generations early instead of running to the model's max_length.
+GENERATION_PROFILES = {
+    "fast": {"num_beams": 1, "length_ratio": 1.5, "length_slack": 8, "max_new_tokens": 128},
+    "balanced": {"num_beams": 1, "length_ratio": 2.0, "length_slack": 16, "max_new_tokens": 256},
+    "quality": {"num_beams": 4, "length_ratio": 2.0, "length_slack": 16, "max_new_tokens": 256},
+}
+
+# Sentence boundary: end punctuation followed by whitespace.
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_sentences(text: str):
+    """Split raw text into sentences on end punctuation and line breaks."""
+    return [
+        sentence
+        for line in str(text).splitlines()
+        for sentence in _SENTENCE_END.split(line.strip())
+        if sentence.strip()
+    ]
+
+
+def split_segments(text, max_words: int = 40):
+    """Split text into lines of segments: sentences, capped at ``max_words`` words.
+
+    ``text`` may also be a list of sentences that were split before
+    normalization stripped their punctuation; they are kept as one line.
+    Sentences longer than ``max_words`` are cut into word windows.
+    """
+    if isinstance(text, str):
+        lines = [_SENTENCE_END.split(line.strip()) for line in text.splitlines()]
+    else:
+        lines = [list(text)]
+
+    result = []
+    for line in lines:
+        segments = []
+        for sentence in line:
+            words = sentence.split()
+            for i in range(0, len(words), max_words):
+                segments.append(" ".join(words[i:i + max_words]))
+        result.append(segments)
+    return result
+
+
+def set_torch_threads(num_threads=0, num_interop_threads=0):
+    """Apply torch intra-op / inter-op thread counts; 0 leaves torch's default."""
+    if not num_threads and not num_interop_threads:
+        return
+    import torch
+
+    if num_threads:
+        torch.set_num_threads(num_threads)
+    if num_interop_threads:
+        try:
+            torch.set_num_interop_threads(num_interop_threads)
+        except RuntimeError as e:
+            # Only allowed once, before any inter-op parallel work has started.
+            logger.warning("could not set torch inter-op threads: %s", e)
+
+
+class SegmentCache:
+    """Thread-safe LRU of translated segments keyed by (profile, src_lang, tgt_lang, segment)."""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
 class Translator:
-    def __init__(self):
+    def __init__(self, max_segment_words=40, batch_size=16, cache_size=4096,
+                 profile=Config.TRANSLATION_PROFILE):
+        if profile not in GENERATION_PROFILES:
+            raise ValueError(f"unknown generation profile: {profile}")
+        set_torch_threads(Config.TORCH_NUM_THREADS, Config.TORCH_NUM_INTEROP_THREADS)
+
         model_name = "facebook/nllb-200-distilled-600M"
         self.tokenizer = AutoTokenizer.from_pretrained(model_name)
         self.model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+        self.profile = profile
+        self.max_segment_words = max_segment_words
+        self.batch_size = batch_size
+        self.cache = SegmentCache(cache_size)
+        # tokenizer.src_lang is shared state; one generate at a time.
+        self._lock = threading.Lock()
 
-    def translate(self, text: str, src_lang="eng_Latn", tgt_lang="zul_Latn"):
-        # Set source language
-        self.tokenizer.src_lang = src_lang
+    def translate(self, text, src_lang="eng_Latn", tgt_lang="zul_Latn", profile=None):
+        """Translate a string, or a list of sentences joined back with spaces."""
+        return self.translate_many([text], src_lang, tgt_lang, profile)[0]
 
-        # Encode
-        encoded = self.tokenizer(text, return_tensors="pt")
+    def translate_many(self, texts, src_lang="eng_Latn", tgt_lang="zul_Latn", profile=None):
+        """Translate several texts (strings or sentence lists), sharing batches and the cache."""
+        profile = profile or self.profile
+        if profile not in GENERATION_PROFILES:
+            raise ValueError(f"unknown generation profile: {profile}")
+        documents = [split_segments(text, self.max_segment_words) for text in texts]
+
+        # Only segments not already cached go to the model, each once.
+        translated = {}
+        missing = []
+        for segment in {s for lines in documents for line in lines for s in line}:
+            cached = self.cache.get((profile, src_lang, tgt_lang, segment))
+            if cached is not None:
+                translated[segment] = cached
+            else:
+                missing.append(segment)
+
+        results = self._translate_batch(missing, src_lang, tgt_lang, profile)
+        for segment, result in zip(missing, results):
+            self.cache.put((profile, src_lang, tgt_lang, segment), result)
+            translated[segment] = result
+
+        return [
+            "\n".join(" ".join(translated[s] for s in line) for line in lines)
+            for lines in documents
+        ]
+
+    def _translate_batch(self, segments, src_lang, tgt_lang, profile):
+        """Translate segments in length-sorted batches; returns results in input order."""
+        order = sorted(range(len(segments)), key=lambda i: len(segments[i]))
+        results = [None] * len(segments)
 
         # ✅ Fix: use convert_tokens_to_ids for target language BOS token
         forced_bos_token_id = self.tokenizer.convert_tokens_to_ids(tgt_lang)
+        settings = GENERATION_PROFILES[profile]
+
+        for start in range(0, len(order), self.batch_size):
+            chunk = order[start:start + self.batch_size]
+            with self._lock:
+                # Set source language
+                self.tokenizer.src_lang = src_lang
+
+                # Encode
+                encoded = self.tokenizer(
+                    [segments[i] for i in chunk], return_tensors="pt", padding=True
+                )
+
+                input_tokens = len(encoded["input_ids"][0])
+                budget = int(settings["length_ratio"] * input_tokens) + settings["length_slack"]
 
-        # Generate translation
-        generated_tokens = self.model.generate(
-            **encoded,
-            forced_bos_token_id=forced_bos_token_id
-        )
-        return self.tokenizer.batch_decode(generated_tokens, skip_special_tokens=True)[0]
+                # Generate translation
+                generated_tokens = self.model.generate(
+                    **encoded,
+                    forced_bos_token_id=forced_bos_token_id,
+                    num_beams=settings["num_beams"],
+                    early_stopping=settings["num_beams"] > 1,
+                    max_new_tokens=min(budget, settings["max_new_tokens"]),
+                )
+            decoded = self.tokenizer.batch_decode(generated_tokens, skip_special_tokens=True)
+            for i, text in zip(chunk, decoded):
+                results[i] = text
+        return results
 
 
 # ✅ Initialize once
@@ -0,0 +1,136 @@
+import bisect
+import threading
+
+from rapidfuzz import fuzz, process
+
+from extensions import db
+from models import Translation
+
+# get_translation accepts a corpus match only when token_sort_ratio > this.
+FUZZY_THRESHOLD = 70
+
+
+def _sorted_length(text: str) -> int:
+    """Length of the string token_sort_ratio actually compares (tokens re-joined)."""
+    return len(" ".join(text.split()))
+
+
+class _FieldIndex:
+    """Snapshot of one corpus column: exact-match hash plus rows ordered by length."""
+
+    def __init__(self, version, rows, normalize):
+        self.version = version
+        self.ids = [row_id for row_id, _ in rows]
+        self.texts = [text for _, text in rows]
+        self.exact = {}
+        for row_id, text in rows:
+            self.exact.setdefault(normalize(text), row_id)
+        lengths = [_sorted_length(t) for t in self.texts]
+        self.by_length = sorted(range(len(rows)), key=lengths.__getitem__)
+        self.lengths = [lengths[i] for i in self.by_length]
+
+
+class TranslationMemory:
+    """Corpus lookup for ``get_translation`` that avoids full fuzzy scans.
+
+    1. Exact hash on the normalized sentence: O(1).
+    2. Length bound: token_sort_ratio is a normalized Indel similarity, so
+       score <= 200 * min(a, b) / (a + b) for string lengths a and b. Only rows
+       whose length can still beat the threshold are scanned; if there are
+       none, the scan is skipped and the caller goes straight to NLLB.
+
+    Indexes are built per database and column on first use and rebuilt when
+    max(id) changes (new rows). Deletes are not detected here: when a returned
+    row has gone, get_translation invalidates and looks up again. In-place
+    edits are not detected at all; anything editing corpus rows should call
+    ``invalidate()``.
+    """
+
+    def __init__(self, normalize, threshold: int = FUZZY_THRESHOLD):
+        self.normalize = normalize
+        self.threshold = threshold
+        self._indexes = {}
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self._stats = {
+                "lookups": 0,
+                "exact_hits": 0,
+                "fuzzy_hits": 0,
+                "fuzzy_misses": 0,
+                "scans_skipped": 0,
+                "rows_scanned": 0,
+                "index_builds": 0,
+            }
+
+    def _count(self, **increments):
+        with self._stats_lock:
+            for key, value in increments.items():
+                self._stats[key] += value
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats["lookups"] or 1
+        stats["exact_hit_rate"] = stats["exact_hits"] / lookups
+        stats["fuzzy_hit_rate"] = stats["fuzzy_hits"] / lookups
+        stats["scan_skip_rate"] = stats["scans_skipped"] / lookups
+        return stats
+
+    def invalidate(self):
+        with self._lock:
+            self._indexes.clear()
+
+    def _index(self, field: str) -> _FieldIndex:
+        key = (str(db.engine.url), field)
+        # max(id) is an index lookup; deletes are caught by get_translation's stale-row retry.
+        version = db.session.query(db.func.max(Translation.id)).scalar()
+        index = self._indexes.get(key)
+        if index is not None and index.version == version:
+            return index
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None or index.version != version:
+                column = getattr(Translation, field)
+                rows = [(row_id, text) for row_id, text in
+                        db.session.query(Translation.id, column).order_by(Translation.id) if text]
+                index = self._indexes[key] = _FieldIndex(version, rows, self.normalize)
+                self._count(index_builds=1)
+        return index
+
+    def lookup(self, sentence: str, field: str):
+        """Return the id of the corpus row matching ``sentence`` in ``field``, or None."""
+        index = self._index(field)
+        self._count(lookups=1)
+
+        row_id = index.exact.get(self.normalize(sentence))
+        if row_id is not None:
+            self._count(exact_hits=1)
+            return row_id
+
+        # Integer form of: score bound > threshold  <=>  lo < length < hi
+        t, n = self.threshold, _sorted_length(sentence)
+        lo = bisect.bisect_right(index.lengths, (t * n) // (200 - t))
+        hi = bisect.bisect_left(index.lengths, -(-(200 - t) * n // t))
+        if lo >= hi:
+            self._count(scans_skipped=1)
+            return None
+
+        # Scan in corpus order so ties resolve like a full scan would.
+        window = sorted(index.by_length[lo:hi])
+        best = process.extractOne(
+            sentence,
+            [index.texts[i] for i in window],
+            scorer=fuzz.token_sort_ratio,
+            processor=None,
+            score_cutoff=t,
+        )
+        self._count(rows_scanned=len(window))
+        if best and best[1] > t:
+            self._count(fuzzy_hits=1)
+            return index.ids[window[best[2]]]
+        self._count(fuzzy_misses=1)
+        return None